@@ -1,12 +1,578 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 from datetime import datetime
 import os
-import base64
+import threading
 from src.backend.data_loader import DataLoader
 from src.backend.optimizer import InventoryOptimizer
-from src.utils.helpers import format_currency, calculate_distance
-import plotly.graph_objects as go
+from src.utils.helpers import format_currency
+
+
+@st.cache_resource
+def _get_optimizer():
+    """Shared optimizer instance, kept warm across reruns and sessions"""
+    return InventoryOptimizer()
+
+
+@st.cache_resource
+def _optimizer_lock():
+    """Lock guarding the shared optimizer's mutable settings"""
+    return threading.Lock()
+
+
+@st.cache_data(ttl="5m", max_entries=8, show_spinner=False)
+def _run_optimization(_optimizer, _warehouses, _orders, run_key, solver_time):
+    """Solve the allocation problem, memoized on the data source and solver settings
+
+    The frames are derived from ``run_key`` (data key plus timestamp), so they are
+    excluded from hashing rather than re-hashed on every call.
+    """
+    # The optimizer is shared across sessions; set its time limit and
+    # solve under one lock so concurrent runs don't mix settings
+    with _optimizer_lock():
+        _optimizer.solver_time = solver_time
+        return _optimizer.optimize(_warehouses, _orders)
+
+
+def _shrink_dtypes(df, int_columns=(), category_columns=()):
+    """Downcast integer columns to int32 and label columns to category"""
+    converted = {}
+    for col in int_columns:
+        # Nullable columns with gaps are left as they are: int32 cannot hold NA
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]) \
+                and not df[col].isna().any() and df[col].abs().max() < 2**31:
+            converted[col] = df[col].astype('int32')
+    for col in category_columns:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype) \
+                and (pd.api.types.is_object_dtype(df[col]) or pd.api.types.is_string_dtype(df[col])):
+            converted[col] = df[col].astype('category')
+    return df.assign(**converted) if converted else df
+
+
+def _prepare_loader(loader):
+    """Shrink the loader's warehouse frame once so repeated sums move fewer bytes"""
+    loader.warehouses_df = _shrink_dtypes(
+        loader.warehouses_df,
+        int_columns=('current_stock', 'capacity')
+    )
+    return loader
+
+
+# Columns the loader cannot do without; everything else in the templates is optional
+_UPLOAD_COLUMNS = {
+    'warehouses': ['warehouse_id', 'capacity', 'current_stock'],
+    'sales': ['order_id', 'quantity']
+}
+
+
+def _check_upload_columns(uploaded_files):
+    """Read only the header row of each upload and reject files missing key columns"""
+    for name, required in _UPLOAD_COLUMNS.items():
+        f = uploaded_files[name]
+        f.seek(0)
+        header = pd.read_csv(f, nrows=0).columns
+        f.seek(0)
+        missing = [col for col in required if col not in header]
+        if missing:
+            raise ValueError(f"{name} file is missing columns: {', '.join(missing)}")
+
+
+# Loaders are shared resources: built once per data source and reused across reruns
+@st.cache_resource(ttl="5m", max_entries=32)
+def _load_sample_data():
+    """Load the bundled sample data"""
+    return _prepare_loader(DataLoader())
+
+
+@st.cache_resource(max_entries=8)
+def _load_uploaded_data(data_key, _uploaded_files):
+    """Parse a set of uploaded CSV files, keyed by their upload ids"""
+    # Fail fast on malformed files before the full parse
+    _check_upload_columns(_uploaded_files)
+    for f in _uploaded_files.values():
+        f.seek(0)
+    return _prepare_loader(DataLoader(uploaded_files=_uploaded_files))
+
+
+# A live database changes underneath us, so its loader expires like the query caches
+@st.cache_resource(ttl="5m", max_entries=8)
+def _connect_database(db_config):
+    """Open a database-backed loader, keyed by its connection settings"""
+    return _prepare_loader(DataLoader(db_config=dict(db_config)))
+
+
+@st.cache_resource(max_entries=8)
+def _connect_sqlite(data_key, _db_file):
+    """Open an uploaded SQLite database, keyed by its upload id"""
+    return _prepare_loader(DataLoader(sqlite_file=_db_file))
+
+
+@st.cache_data
+def _read_template(filename):
+    """Read a template CSV from the data directory, or None if it is missing"""
+    filepath = os.path.join('data', filename)
+    try:
+        with open(filepath, 'rb') as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+def _upload_key(prefix, *files):
+    """Build a cache key from upload ids, without reading or hashing file contents"""
+    return prefix + ":" + "|".join(f"{f.file_id}:{f.size}" for f in files)
+
+
+def _to_arrow_backed(df):
+    """Convert a display-only frame to pyarrow dtypes so rendering skips the Arrow conversion"""
+    return df.convert_dtypes(dtype_backend="pyarrow")
+
+
+# Query results are memoized per (data source, timestamp); the loader itself is not hashed
+@st.cache_data(ttl="5m", max_entries=32)
+def _pending_orders(_loader, data_key, now):
+    return _shrink_dtypes(
+        _loader.get_pending_orders(now),
+        int_columns=('quantity',),
+        category_columns=('status', 'region')
+    )
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _urgent_orders(_loader, data_key):
+    return _to_arrow_backed(_loader.get_urgent_orders())
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _reorder_needs(_loader, data_key):
+    return _loader.calculate_reorder_needs()
+
+
+# Overview metrics only need row counts; caching the int avoids unpickling whole frames
+@st.cache_data(ttl="5m", max_entries=32)
+def _pending_order_count(_loader, data_key, now):
+    return len(_pending_orders(_loader, data_key, now))
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _urgent_order_count(_loader, data_key):
+    return len(_urgent_orders(_loader, data_key))
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _reorder_count(_loader, data_key):
+    return len(_reorder_needs(_loader, data_key))
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _warehouse_utilization(_loader, data_key):
+    # One row per warehouse, oriented once here rather than on every render
+    return pd.DataFrame(_loader.get_warehouse_utilization()).T
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _inventory_status(_loader, data_key):
+    return _to_arrow_backed(_loader.get_current_inventory_status())
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _order_history(_loader, data_key, now):
+    return _to_arrow_backed(_loader.get_order_history(now))
+
+
+@st.cache_data(ttl="5m", max_entries=32)
+def _supplier_performance(_loader, data_key):
+    return _to_arrow_backed(_loader.get_supplier_performance())
+
+
+# Coordinate columns needed for the distribution map
+_WAREHOUSE_COORDS = frozenset({'latitude', 'longitude'})
+_ORDER_COORDS = frozenset({'delivery_latitude', 'delivery_longitude'})
+
+
+def _has_coordinates(warehouses, orders):
+    """Whether both frames carry the coordinate columns"""
+    return _WAREHOUSE_COORDS.issubset(warehouses.columns) and \
+        _ORDER_COORDS.issubset(orders.columns)
+
+
+@st.cache_data(max_entries=8)
+def _build_distribution_fig(warehouses, orders, allocation_plan):
+    """Build the distribution map figure, memoized on its inputs"""
+    # Imported here so sessions that never open the map don't pay for plotly
+    import plotly.graph_objects as go
+
+    # Build hover labels column-wise instead of per row
+    warehouse_text = (
+        "Name: " + warehouses['name'].astype(str) +
+        "<br>Stock: " + warehouses['current_stock'].map('{:,}'.format) + " units"
+    )
+    order_text = (
+        "Order ID: " + orders['order_id'].astype(str) +
+        "<br>Quantity: " + orders['quantity'].map('{:,}'.format) + " units"
+    )
+
+    # Create figure
+    fig = go.Figure()
+
+    # Add warehouses to the map
+    fig.add_trace(go.Scattergeo(
+        lon=warehouses['longitude'].to_numpy(),
+        lat=warehouses['latitude'].to_numpy(),
+        text=warehouse_text.values,
+        mode='markers',
+        name='Warehouses',
+        marker=dict(
+            size=12,
+            symbol='square',
+            color='blue',
+            line=dict(
+                width=1,
+                color='white'
+            )
+        ),
+        hovertemplate=(
+            "<b>Warehouse</b><br>" +
+            "%{text}<br>" +
+            "Location: (%{lat:.4f}, %{lon:.4f})<br>" +
+            "<extra></extra>"
+        )
+    ))
+
+    # Add delivery locations (orders) to the map
+    fig.add_trace(go.Scattergeo(
+        lon=orders['delivery_longitude'].to_numpy(),
+        lat=orders['delivery_latitude'].to_numpy(),
+        text=order_text.values,
+        mode='markers',
+        name='Delivery Locations',
+        marker=dict(
+            size=8,
+            symbol='circle',
+            color='red',
+            line=dict(
+                width=1,
+                color='white'
+            )
+        ),
+        hovertemplate=(
+            "<b>Delivery Location</b><br>" +
+            "%{text}<br>" +
+            "Location: (%{lat:.4f}, %{lon:.4f})<br>" +
+            "<extra></extra>"
+        )
+    ))
+
+    # Flatten the allocation plan into one row per route
+    routes = [
+        (warehouse_id, order_id, quantity)
+        for warehouse_id, allocations in allocation_plan
+        for order_id, quantity in allocations
+    ]
+
+    if routes:
+        route_warehouses, route_orders, route_quantities = zip(*routes)
+
+        # Pull route endpoints as arrays with one indexed lookup per side; repeated
+        # ids resolve to their first row so every route keeps exactly one endpoint
+        origins = warehouses[~warehouses['warehouse_id'].duplicated()] \
+            .set_index('warehouse_id').loc[list(route_warehouses)]
+        destinations = orders[~orders['order_id'].duplicated()] \
+            .set_index('order_id').loc[list(route_orders)]
+        start_lons = origins['longitude'].to_numpy(np.float64)
+        start_lats = origins['latitude'].to_numpy(np.float64)
+        end_lons = destinations['delivery_longitude'].to_numpy(np.float64)
+        end_lats = destinations['delivery_latitude'].to_numpy(np.float64)
+
+        # Curved paths bend through a raised midpoint
+        mid_lons = (start_lons + end_lons) / 2
+        mid_lats = (start_lats + end_lats) / 2 + 1
+
+        # All routes go into one None-separated line trace
+        gaps = np.full(len(routes), None)
+        route_lons = np.column_stack([start_lons, mid_lons, end_lons, gaps]).ravel().tolist()
+        route_lats = np.column_stack([start_lats, mid_lats, end_lats, gaps]).ravel().tolist()
+
+        route_text = [
+            f"From: {name}<br>"
+            f"To: Order {order_id}<br>"
+            f"Quantity: {quantity:,} units"
+            for name, order_id, quantity in zip(origins['name'], route_orders, route_quantities)
+        ]
+
+        fig.add_trace(go.Scattergeo(
+            lon=route_lons,
+            lat=route_lats,
+            mode='lines',
+            line=dict(
+                width=1,
+                color='rgba(0,150,0,0.3)'
+            ),
+            name='Allocation Routes',
+            showlegend=False,
+            hoverinfo='skip'
+        ))
+
+        # Invisible midpoint markers carry the per-route hover labels
+        fig.add_trace(go.Scattergeo(
+            lon=mid_lons,
+            lat=mid_lats,
+            text=route_text,
+            mode='markers',
+            marker=dict(
+                size=6,
+                color='rgba(0,150,0,0)'
+            ),
+            name='Allocation Routes',
+            showlegend=False,
+            hovertemplate=(
+                "<b>Allocation Route</b><br>" +
+                "%{text}<br>" +
+                "<extra></extra>"
+            )
+        ))
+
+    # Calculate map bounds
+    all_lons = np.concatenate([
+        warehouses['longitude'].to_numpy(), orders['delivery_longitude'].to_numpy()
+    ])
+    all_lats = np.concatenate([
+        warehouses['latitude'].to_numpy(), orders['delivery_latitude'].to_numpy()
+    ])
+    
+    lon_min, lon_max = all_lons.min(), all_lons.max()
+    lat_min, lat_max = all_lats.min(), all_lats.max()
+    lon_range = lon_max - lon_min
+    lat_range = lat_max - lat_min
+    
+    center_lon = all_lons.mean()
+    center_lat = all_lats.mean()
+
+    # Update layout with dynamic bounds
+    fig.update_layout(
+        title={
+            'text': 'Global Distribution Map',
+            'y':0.95,
+            'x':0.5,
+            'xanchor': 'center',
+            'yanchor': 'top'
+        },
+        showlegend=True,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01,
+            bgcolor="rgba(255, 255, 255, 0.8)"
+        ),
+        geo=dict(
+            projection_type='equirectangular',
+            showland=True,
+            showcountries=True,
+            showocean=True,
+            countrywidth=0.5,
+            landcolor='rgb(243, 243, 243)',
+            oceancolor='rgb(230, 230, 250)',
+            countrycolor='rgb(204, 204, 204)',
+            coastlinecolor='rgb(204, 204, 204)',
+            # Dynamic center and zoom
+            center=dict(
+                lon=center_lon,
+                lat=center_lat
+            ),
+            # Dynamic zoom based on data points
+            lonaxis=dict(
+                range=[lon_min - lon_range*0.1, lon_max + lon_range*0.1]
+            ),
+            lataxis=dict(
+                range=[lat_min - lat_range*0.1, lat_max + lat_range*0.1]
+            )
+        ),
+        height=600,
+    )
+
+    return fig
+
+
+# User guide content is static, so it is built once at import time
+_GUIDE_INTRO = """
+        Welcome to LogiTrack - Your Comprehensive Inventory Management System! 
+        This guide will help you understand how to use all the features effectively.
+        """
+
+_GUIDE_GETTING_STARTED = """
+            ### Welcome to LogiTrack
+            Current System Time: `{now} UTC`
+            
+            #### Quick Start
+            1. **Login**: Enter your username to access the system
+            2. **Select Data Source**: Choose from:
+            - Sample Data (for testing)
+            - Upload Your Data
+            - Database Connection
+            3. **Navigate**: Use the sidebar to access different features
+            
+            #### Basic Navigation
+            - **Sidebar**: Contains main navigation and controls
+            - **Top Bar**: Shows current user and system time
+            - **Main Area**: Displays selected feature content
+            """
+
+_GUIDE_FEATURES = (
+    ("### 📊 Overview", """
+            The Overview dashboard provides:
+            - Total Inventory Status
+            - Pending Orders Count
+            - Urgent Orders Alert
+            - Products Needing Reorder
+            - Warehouse Utilization Charts
+            """),
+    ("### 📦 Inventory Management", """
+            Track and manage your inventory:
+            - View current stock levels
+            - Monitor warehouse capacity
+            - Check storage costs
+            - Track last update times
+            """),
+    ("### 📋 Order Management", """
+            Handle all order-related tasks:
+            - View pending orders
+            - Track urgent orders
+            - Check order history
+            - Monitor delivery deadlines
+            """),
+    ("### 🤝 Supplier Management", """
+            Manage supplier relationships:
+            - View supplier performance metrics
+            - Track reliability scores
+            - Monitor lead times
+            - Check quality scores
+            """),
+    ("### 🔄 Optimization", """
+            Optimize your inventory distribution:
+            - Run distribution optimization
+            - View cost analysis
+            - Check warehouse utilization
+            - Monitor unfulfilled orders
+            """),
+)
+
+_GUIDE_DATA_FORMATS = (
+    ("Warehouse Data Format", """
+    warehouse_id,name,capacity,current_stock,location,storage_cost,latitude,longitude
+    W001,Mumbai Central,10000,7500,Mumbai,1200,19.0760,72.8777
+    W002,Singapore Hub,15000,12000,Singapore,1500,1.3521,103.8198
+                """),
+    ("Sales/Orders Data Format", """
+    order_id,date,product_id,quantity,delivery_deadline,status,delivery_latitude,delivery_longitude
+    ORD001,2025-03-24,P001,500,2025-03-26,Pending,19.0760,72.8777
+    ORD002,2025-03-24,P002,750,2025-03-25,Urgent,1.3521,103.8198
+                """),
+)
+
+_GUIDE_UPLOAD_STEPS = """
+            1. Prepare your CSV files following the sample format
+            2. Select "Upload Data" as your data source
+            3. Upload your files using the provided interface
+            4. System will validate your data format
+            5. Confirm successful data loading
+            """
+
+_GUIDE_OPTIMIZATION = """
+            ### Running Optimization
+            
+            1. **Preparation**
+            - Ensure all warehouse data is up-to-date
+            - Check pending orders
+            - Verify delivery locations
+            
+            2. **Configuration**
+            - Set solver time limit
+            - Choose priority weights
+            - Review optimization parameters
+            
+            3. **Execution**
+            - Click "Run Optimization"
+            - Wait for results
+            - Review allocation plan
+            
+            4. **Results Analysis**
+            - Check fulfillment rate
+            - Review cost analysis
+            - Monitor warehouse utilization
+            - Address unfulfilled orders
+            """
+
+_GUIDE_TROUBLESHOOTING = (
+    ("Data Loading Errors", """
+                - Verify CSV file format
+                - Check required columns
+                - Ensure valid coordinates
+                - Confirm date formats
+                """),
+    ("Optimization Issues", """
+                - Check warehouse capacity
+                - Verify order quantities
+                - Confirm delivery locations
+                - Review cost parameters
+                """),
+    ("Display Problems", """
+                - Refresh the page
+                - Clear browser cache
+                - Check data source
+                - Verify timestamps
+                """),
+)
+
+
+# Columns the optimization view and solver rely on
+_WAREHOUSE_REQUIRED = frozenset({'warehouse_id', 'capacity', 'current_stock'})
+_ORDER_REQUIRED = frozenset({'order_id', 'quantity', 'region'})
+
+
+def _validate_optimization_inputs(warehouses, orders):
+    """Return a list of problems that would make the optimization fail"""
+    problems = []
+    for label, df, required, numeric in (
+        ("Warehouse data", warehouses, _WAREHOUSE_REQUIRED, ('capacity', 'current_stock')),
+        ("Pending orders", orders, _ORDER_REQUIRED, ('quantity',))
+    ):
+        missing = required.difference(df.columns)
+        if missing:
+            problems.append(f"{label} is missing columns: {', '.join(sorted(missing))}")
+            continue
+        columns = sorted(required)
+        with_gaps = df[columns].columns[df[columns].isna().any()]
+        if len(with_gaps):
+            problems.append(f"{label} has empty values in: {', '.join(with_gaps)}")
+        for col in numeric:
+            if not pd.api.types.is_numeric_dtype(df[col]):
+                problems.append(f"{label} column '{col}' must be numeric")
+            elif (df[col] < 0).any():
+                problems.append(f"{label} column '{col}' has negative values")
+    if not problems and warehouses.empty:
+        problems.append("There are no warehouses to allocate from")
+    if not problems and orders.empty:
+        problems.append("There are no pending orders to optimize")
+    return problems
+
+
+_FOOTER_HTML = (
+    "<p style='text-align: center;'>© 2025 | Made with ♥ by "
+    "<a href='https://github.com/tanishpoddar' target='_blank' "
+    "style='color: inherit; text-decoration: none;'>Tanish Poddar</a></p>"
+)
+
+
+# Rows sent per page of potentially large result tables
+_TABLE_PAGE_ROWS = 1000
+
+
+def _show_table(df):
+    """Render a frame at container width, dropping integer positional indices"""
+    st.dataframe(df, hide_index=pd.api.types.is_integer_dtype(df.index), use_container_width=True)
+
 
 class LogiTrackApp:
     def __init__(self):
@@ -24,19 +590,8 @@ class LogiTrackApp:
         
         # Initialize data loader and optimizer
         self.data_loader = None
-        self.optimizer = InventoryOptimizer()
-
-    def get_file_download_link(self, filename):
-        """Generate a download link for a file"""
-        filepath = os.path.join('data', filename)
-        try:
-            with open(filepath, 'rb') as f:
-                bytes = f.read()
-            b64 = base64.b64encode(bytes).decode()
-            href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">Download {filename}</a>'
-            return href
-        except FileNotFoundError:
-            return f"File not found: {filename}"
+        self.data_key = None
+        self.optimizer = _get_optimizer()
 
     def login_page(self):
         """Display login page"""
@@ -72,7 +627,8 @@ class LogiTrackApp:
         )
 
         if data_source == "Sample Data":
-            self.data_loader = DataLoader()
+            self.data_loader = _load_sample_data()
+            self.data_key = "sample"
             st.sidebar.success("✅ Sample data loaded successfully!")
             return True
             
@@ -92,8 +648,16 @@ class LogiTrackApp:
             # Show template downloads
             st.sidebar.markdown("📑 **Templates:**")
             for file_type, filename in required_files.items():
-                download_link = self.get_file_download_link(filename)
-                st.sidebar.markdown(download_link, unsafe_allow_html=True)
+                template = _read_template(filename)
+                if template is None:
+                    st.sidebar.markdown(f"File not found: {filename}")
+                else:
+                    st.sidebar.download_button(
+                        f"Download {filename}",
+                        template,
+                        file_name=filename,
+                        mime='text/csv'
+                    )
 
             # File uploaders
             uploaded_files['warehouses'] = st.sidebar.file_uploader("Upload Warehouses Data", type=['csv'])
@@ -104,7 +668,8 @@ class LogiTrackApp:
 
             if all(uploaded_files.values()):
                 try:
-                    self.data_loader = DataLoader(uploaded_files=uploaded_files)
+                    self.data_key = _upload_key("upload", *uploaded_files.values())
+                    self.data_loader = _load_uploaded_data(self.data_key, uploaded_files)
                     st.sidebar.success("✅ Custom data loaded successfully!")
                     return True
                 except Exception as e:
@@ -128,16 +693,15 @@ class LogiTrackApp:
                 
                 if st.sidebar.button("Connect"):
                     try:
-                        self.data_loader = DataLoader(
-                            db_config={
-                                'type': db_type,
-                                'host': host,
-                                'port': port,
-                                'database': database,
-                                'username': username,
-                                'password': password
-                            }
-                        )
+                        self.data_loader = _connect_database((
+                            ('type', db_type),
+                            ('host', host),
+                            ('port', port),
+                            ('database', database),
+                            ('username', username),
+                            ('password', password)
+                        ))
+                        self.data_key = f"db:{db_type}:{host}:{port}:{database}:{username}"
                         st.sidebar.success("✅ Connected to database successfully!")
                         return True
                     except Exception as e:
@@ -147,7 +711,8 @@ class LogiTrackApp:
                 db_file = st.sidebar.file_uploader("Upload SQLite Database", type=['db', 'sqlite'])
                 if db_file:
                     try:
-                        self.data_loader = DataLoader(sqlite_file=db_file)
+                        self.data_key = _upload_key("sqlite", db_file)
+                        self.data_loader = _connect_sqlite(self.data_key, db_file)
                         st.sidebar.success("✅ Connected to SQLite database successfully!")
                         return True
                     except Exception as e:
@@ -155,15 +720,13 @@ class LogiTrackApp:
                         return False
 
         return False
+    @st.fragment
     def show_guide(self):
         """Display the user guide/documentation"""
         st.title("📚 LogiTrack User Guide")
         
         # Introduction
-        st.markdown("""
-        Welcome to LogiTrack - Your Comprehensive Inventory Management System! 
-        This guide will help you understand how to use all the features effectively.
-        """)
+        st.markdown(_GUIDE_INTRO)
         
         # Navigation using tabs
         tab_main, tab_features, tab_data, tab_optimize, tab_troubleshoot = st.tabs([
@@ -172,79 +735,19 @@ class LogiTrackApp:
         
         with tab_main:
             st.subheader("🚀 Getting Started")
-            st.markdown("""
-            ### Welcome to LogiTrack
-            Current System Time: `2025-03-24 21:13:19 UTC`
-            
-            #### Quick Start
-            1. **Login**: Enter your username to access the system
-            2. **Select Data Source**: Choose from:
-            - Sample Data (for testing)
-            - Upload Your Data
-            - Database Connection
-            3. **Navigate**: Use the sidebar to access different features
-            
-            #### Basic Navigation
-            - **Sidebar**: Contains main navigation and controls
-            - **Top Bar**: Shows current user and system time
-            - **Main Area**: Displays selected feature content
-            """)
+            # _now is local time for the loader's filters; the guide labels its clock UTC
+            st.markdown(_GUIDE_GETTING_STARTED.format(
+                now=pd.Timestamp.now(tz="UTC").strftime("%Y-%m-%d %H:%M:%S")
+            ))
             
             st.info("💡 Tip: Start with the Overview page to get a snapshot of your inventory system!")
 
         with tab_features:
             st.subheader("🎯 Features Guide")
             
-            # Overview Section
-            st.markdown("### 📊 Overview")
-            st.markdown("""
-            The Overview dashboard provides:
-            - Total Inventory Status
-            - Pending Orders Count
-            - Urgent Orders Alert
-            - Products Needing Reorder
-            - Warehouse Utilization Charts
-            """)
-            
-            # Inventory Management
-            st.markdown("### 📦 Inventory Management")
-            st.markdown("""
-            Track and manage your inventory:
-            - View current stock levels
-            - Monitor warehouse capacity
-            - Check storage costs
-            - Track last update times
-            """)
-            
-            # Order Management
-            st.markdown("### 📋 Order Management")
-            st.markdown("""
-            Handle all order-related tasks:
-            - View pending orders
-            - Track urgent orders
-            - Check order history
-            - Monitor delivery deadlines
-            """)
-            
-            # Supplier Management
-            st.markdown("### 🤝 Supplier Management")
-            st.markdown("""
-            Manage supplier relationships:
-            - View supplier performance metrics
-            - Track reliability scores
-            - Monitor lead times
-            - Check quality scores
-            """)
-            
-            # Optimization
-            st.markdown("### 🔄 Optimization")
-            st.markdown("""
-            Optimize your inventory distribution:
-            - Run distribution optimization
-            - View cost analysis
-            - Check warehouse utilization
-            - Monitor unfulfilled orders
-            """)
+            for heading, body in _GUIDE_FEATURES:
+                st.markdown(heading)
+                st.markdown(body)
 
         with tab_data:
             st.subheader("💾 Data Management Guide")
@@ -252,56 +755,17 @@ class LogiTrackApp:
             # Sample Data Format
             st.markdown("### Sample Data Format")
             
-            with st.expander("Warehouse Data Format"):
-                st.code("""
-    warehouse_id,name,capacity,current_stock,location,storage_cost,latitude,longitude
-    W001,Mumbai Central,10000,7500,Mumbai,1200,19.0760,72.8777
-    W002,Singapore Hub,15000,12000,Singapore,1500,1.3521,103.8198
-                """)
-                
-            with st.expander("Sales/Orders Data Format"):
-                st.code("""
-    order_id,date,product_id,quantity,delivery_deadline,status,delivery_latitude,delivery_longitude
-    ORD001,2025-03-24,P001,500,2025-03-26,Pending,19.0760,72.8777
-    ORD002,2025-03-24,P002,750,2025-03-25,Urgent,1.3521,103.8198
-                """)
+            for title, sample in _GUIDE_DATA_FORMATS:
+                with st.expander(title):
+                    st.code(sample)
             
             # File Upload Guide
             st.markdown("### 📤 Uploading Your Data")
-            st.markdown("""
-            1. Prepare your CSV files following the sample format
-            2. Select "Upload Data" as your data source
-            3. Upload your files using the provided interface
-            4. System will validate your data format
-            5. Confirm successful data loading
-            """)
+            st.markdown(_GUIDE_UPLOAD_STEPS)
 
         with tab_optimize:
             st.subheader("⚙️ Optimization Guide")
-            st.markdown("""
-            ### Running Optimization
-            
-            1. **Preparation**
-            - Ensure all warehouse data is up-to-date
-            - Check pending orders
-            - Verify delivery locations
-            
-            2. **Configuration**
-            - Set solver time limit
-            - Choose priority weights
-            - Review optimization parameters
-            
-            3. **Execution**
-            - Click "Run Optimization"
-            - Wait for results
-            - Review allocation plan
-            
-            4. **Results Analysis**
-            - Check fulfillment rate
-            - Review cost analysis
-            - Monitor warehouse utilization
-            - Address unfulfilled orders
-            """)
+            st.markdown(_GUIDE_OPTIMIZATION)
 
         with tab_troubleshoot:
             st.subheader("❓ Troubleshooting")
@@ -309,28 +773,7 @@ class LogiTrackApp:
             # Common Issues
             st.markdown("### Common Issues and Solutions")
             
-            issues = {
-                "Data Loading Errors": """
-                - Verify CSV file format
-                - Check required columns
-                - Ensure valid coordinates
-                - Confirm date formats
-                """,
-                "Optimization Issues": """
-                - Check warehouse capacity
-                - Verify order quantities
-                - Confirm delivery locations
-                - Review cost parameters
-                """,
-                "Display Problems": """
-                - Refresh the page
-                - Clear browser cache
-                - Check data source
-                - Verify timestamps
-                """
-            }
-            
-            for issue, solution in issues.items():
+            for issue, solution in _GUIDE_TROUBLESHOOTING:
                 with st.expander(issue):
                     st.markdown(solution)
 
@@ -349,15 +792,15 @@ class LogiTrackApp:
                 f"{(total_inventory/total_capacity)*100:.1f}% of capacity"
             )
         
-        pending_orders = len(self.data_loader.get_pending_orders(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+        pending_orders = _pending_order_count(self.data_loader, self.data_key, st.session_state._now)
         with col2:
             st.metric("Pending Orders", pending_orders)
         
-        urgent_orders = len(self.data_loader.get_urgent_orders())
+        urgent_orders = _urgent_order_count(self.data_loader, self.data_key)
         with col3:
             st.metric("Urgent Orders", urgent_orders)
         
-        reorder_needs = len(self.data_loader.calculate_reorder_needs())
+        reorder_needs = _reorder_count(self.data_loader, self.data_key)
         with col4:
             st.metric("Products to Reorder", reorder_needs)
 
@@ -365,56 +808,43 @@ class LogiTrackApp:
         """Display current inventory status"""
         st.subheader("📦 Inventory Status")
         
-        warehouse_util = pd.DataFrame(self.data_loader.get_warehouse_utilization()).T
+        warehouse_util = _warehouse_utilization(self.data_loader, self.data_key)
         st.bar_chart(warehouse_util['utilization'])
         
-        st.dataframe(self.data_loader.get_current_inventory_status())
+        _show_table(_inventory_status(self.data_loader, self.data_key))
 
-    def show_order_management(self):
+    @st.fragment
+    def show_order_management(self, pending_orders):
         """Display order management section"""
         st.subheader("📋 Order Management")
         
         tabs = st.tabs(["Pending Orders", "Urgent Orders", "Order History"])
         
+        now = st.session_state._now
         with tabs[0]:
-            pending_orders = self.data_loader.get_pending_orders(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            st.dataframe(pending_orders)
+            _show_table(pending_orders)
             
         with tabs[1]:
-            urgent_orders = self.data_loader.get_urgent_orders()
-            st.dataframe(urgent_orders)
+            urgent_orders = _urgent_orders(self.data_loader, self.data_key)
+            _show_table(urgent_orders)
             
         with tabs[2]:
-            history = self.data_loader.get_order_history(datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            st.dataframe(history)
+            history = _order_history(self.data_loader, self.data_key, now)
+            _show_table(history)
 
+    @st.fragment
     def show_supplier_info(self):
         """Display supplier information"""
         st.subheader("🤝 Supplier Performance")
-        supplier_perf = self.data_loader.get_supplier_performance()
+        supplier_perf = _supplier_performance(self.data_loader, self.data_key)
         
         st.bar_chart(supplier_perf.set_index('supplier_name')[['reliability_score', 'lead_time_reliability']])
-        st.dataframe(supplier_perf)
+        _show_table(supplier_perf)
     def show_distribution_map(self, warehouses, orders, allocation_results):
         """Display the distribution map visualization"""
         try:
-            import plotly.graph_objects as go
-            import numpy as np
-
             # Check if coordinates exist in the data
-            required_columns = {
-                'warehouses': ['latitude', 'longitude'],
-                'orders': ['delivery_latitude', 'delivery_longitude']
-            }
-
-            missing_columns = {
-                'warehouses': [col for col in required_columns['warehouses'] 
-                            if col not in warehouses.columns],
-                'orders': [col for col in required_columns['orders'] 
-                        if col not in orders.columns]
-            }
-
-            if any(missing_columns.values()):
+            if not _has_coordinates(warehouses, orders):
                 st.warning("⚠️ Location data is incomplete. Map visualization requires latitude and longitude coordinates.")
                 st.info("""
                 To use the map visualization, please ensure your data includes:
@@ -423,153 +853,18 @@ class LogiTrackApp:
                 """)
                 return
 
-            # Create figure
-            fig = go.Figure()
-
-            # Add warehouses to the map
-            fig.add_trace(go.Scattergeo(
-                lon=warehouses['longitude'],
-                lat=warehouses['latitude'],
-                text=warehouses.apply(
-                    lambda x: f"Name: {x['name']}<br>Stock: {x['current_stock']:,} units", 
-                    axis=1
-                ),
-                mode='markers',
-                name='Warehouses',
-                marker=dict(
-                    size=12,
-                    symbol='square',
-                    color='blue',
-                    line=dict(
-                        width=1,
-                        color='white'
-                    )
-                ),
-                hovertemplate=(
-                    "<b>Warehouse</b><br>" +
-                    "%{text}<br>" +
-                    "Location: (%{lat:.4f}, %{lon:.4f})<br>" +
-                    "<extra></extra>"
-                )
-            ))
-
-            # Add delivery locations (orders) to the map
-            fig.add_trace(go.Scattergeo(
-                lon=orders['delivery_longitude'],
-                lat=orders['delivery_latitude'],
-                text=orders.apply(
-                    lambda x: f"Order ID: {x['order_id']}<br>Quantity: {x['quantity']:,} units", 
-                    axis=1
-                ),
-                mode='markers',
-                name='Delivery Locations',
-                marker=dict(
-                    size=8,
-                    symbol='circle',
-                    color='red',
-                    line=dict(
-                        width=1,
-                        color='white'
-                    )
-                ),
-                hovertemplate=(
-                    "<b>Delivery Location</b><br>" +
-                    "%{text}<br>" +
-                    "Location: (%{lat:.4f}, %{lon:.4f})<br>" +
-                    "<extra></extra>"
+            fig = _build_distribution_fig(
+                warehouses,
+                orders,
+                tuple(
+                    (warehouse_id, tuple((a['order_id'], a['quantity']) for a in allocations))
+                    for warehouse_id, allocations in allocation_results['allocation_plan'].items()
                 )
-            ))
-
-            # Add allocation lines with curved paths
-            for warehouse_id, allocations in allocation_results['allocation_plan'].items():
-                warehouse = warehouses[warehouses['warehouse_id'] == warehouse_id].iloc[0]
-                
-                for allocation in allocations:
-                    order = orders[orders['order_id'] == allocation['order_id']].iloc[0]
-                    
-                    # Create curved path
-                    lons = [warehouse['longitude'], order['delivery_longitude']]
-                    lats = [warehouse['latitude'], order['delivery_latitude']]
-                    
-                    # Calculate path points
-                    center_lon = np.mean(lons)
-                    center_lat = np.mean(lats)
-                    
-                    # Add curved path
-                    fig.add_trace(go.Scattergeo(
-                        lon=[lons[0], center_lon, lons[1]],
-                        lat=[lats[0], center_lat + 1, lats[1]],
-                        mode='lines',
-                        line=dict(
-                            width=1,
-                            color='rgba(0,150,0,0.3)'
-                        ),
-                        name=f'Route: {warehouse_id} → {allocation["order_id"]}',
-                        showlegend=False,
-                        hovertemplate=(
-                            f"<b>Allocation Route</b><br>" +
-                            f"From: {warehouse['name']}<br>" +
-                            f"To: Order {allocation['order_id']}<br>" +
-                            f"Quantity: {allocation['quantity']:,} units<br>" +
-                            "<extra></extra>"
-                        )
-                    ))
-
-            # Calculate map bounds
-            all_lons = warehouses['longitude'].tolist() + orders['delivery_longitude'].tolist()
-            all_lats = warehouses['latitude'].tolist() + orders['delivery_latitude'].tolist()
-            
-            lon_range = max(all_lons) - min(all_lons)
-            lat_range = max(all_lats) - min(all_lats)
-            
-            center_lon = np.mean(all_lons)
-            center_lat = np.mean(all_lats)
-
-            # Update layout with dynamic bounds
-            fig.update_layout(
-                title={
-                    'text': 'Global Distribution Map',
-                    'y':0.95,
-                    'x':0.5,
-                    'xanchor': 'center',
-                    'yanchor': 'top'
-                },
-                showlegend=True,
-                legend=dict(
-                    yanchor="top",
-                    y=0.99,
-                    xanchor="left",
-                    x=0.01,
-                    bgcolor="rgba(255, 255, 255, 0.8)"
-                ),
-                geo=dict(
-                    projection_type='equirectangular',
-                    showland=True,
-                    showcountries=True,
-                    showocean=True,
-                    countrywidth=0.5,
-                    landcolor='rgb(243, 243, 243)',
-                    oceancolor='rgb(230, 230, 250)',
-                    countrycolor='rgb(204, 204, 204)',
-                    coastlinecolor='rgb(204, 204, 204)',
-                    # Dynamic center and zoom
-                    center=dict(
-                        lon=center_lon,
-                        lat=center_lat
-                    ),
-                    # Dynamic zoom based on data points
-                    lonaxis=dict(
-                        range=[min(all_lons) - lon_range*0.1, max(all_lons) + lon_range*0.1]
-                    ),
-                    lataxis=dict(
-                        range=[min(all_lats) - lat_range*0.1, max(all_lats) + lat_range*0.1]
-                    )
-                ),
-                height=600,
             )
 
-            # Display the map
-            st.plotly_chart(fig, use_container_width=True)
+            # Display the map; a stable key lets the frontend update the existing
+            # chart in place instead of remounting it on every rerun
+            st.plotly_chart(fig, use_container_width=True, key="distribution_map")
 
         except Exception as e:
             st.error(f"Error generating distribution map: {str(e)}")
@@ -580,12 +875,178 @@ class LogiTrackApp:
             - Orders: delivery_latitude, delivery_longitude
             """)
 
+    @st.fragment
+    def show_optimization(self, orders):
+        """Display optimization controls and results"""
+        st.subheader("🔄 Inventory Optimization")
+        
+        # Parameters live inside the fragment (fragments cannot write to the sidebar)
+        # so adjusting them only reruns this section
+        st.markdown("**Optimization Parameters**")
+        param_col1, param_col2 = st.columns(2)
+        with param_col1:
+            solver_time = st.slider(
+                "Solver Time Limit (seconds)",
+                min_value=5,
+                max_value=60,
+                value=20
+            )
+        with param_col2:
+            priority_weight = st.select_slider(
+                "Order Priority Weight",
+                options=["Low", "Medium", "High"],
+                value="Medium"
+            )
+        
+        warehouses = self.data_loader.warehouses_df
+        run_key = (self.data_key, self.data_loader.current_datetime)
+        has_coordinates = _has_coordinates(warehouses, orders)
+        run_clicked = st.button("🚀 Run Optimization")
+        
+        # Results are kept in session state, so later reruns redisplay them without
+        # re-solving as long as the underlying data has not changed
+        if not run_clicked and st.session_state.get('optimization', (None,))[0] != run_key:
+            return
+        
+        # Cheap pre-flight checks so bad inputs never reach the solver
+        problems = _validate_optimization_inputs(warehouses, orders)
+        if problems:
+            for problem in problems:
+                st.error(problem)
+            st.error("Please check your data and try again")
+            return
+        
+        try:
+            with st.spinner("Optimizing inventory distribution..."):
+                st.info("📊 Optimization Overview")
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.write("Warehouses in scope:", len(warehouses))
+                    st.write("Total warehouse capacity:", f"{warehouses['capacity'].sum():,} units")
+                    st.write("Current total stock:", f"{warehouses['current_stock'].sum():,} units")
+                with col2:
+                    st.write("Pending orders:", len(orders))
+                    st.write("Total order quantity:", f"{orders['quantity'].sum():,} units")
+                    st.write("Unique delivery regions:", orders['region'].nunique())
+                
+                if run_clicked:
+                    results = _run_optimization(
+                        self.optimizer, warehouses, orders, run_key, solver_time
+                    )
+                    # The unfulfilled-orders frame is built once per solve and kept
+                    # alongside the results, so redisplays don't rebuild it
+                    st.session_state.optimization = (
+                        run_key, results, pd.DataFrame(results['unfulfilled_orders'])
+                    )
+                _, results, unfulfilled_df = st.session_state.optimization
+                
+                st.success("✅ Optimization complete!")
+                
+                # Show results in columns
+                col1, col2, col3, col4 = st.columns(4)
+                with col1:
+                    st.metric(
+                        "Total Cost", 
+                        f"${results['total_cost']:,.2f}",
+                        delta="-10%"
+                    )
+                with col2:
+                    st.metric(
+                        "Solving Time", 
+                        f"{results['solving_time']:.2f}s"
+                    )
+                with col3:
+                    st.metric(
+                        "Status", 
+                        results['status']
+                    )
+                with col4:
+                    fulfilled_percent = 100 - (len(results['unfulfilled_orders']) / len(orders) * 100)
+                    st.metric(
+                        "Order Fulfillment",
+                        f"{fulfilled_percent:.1f}%"
+                    )
+                
+                # Show detailed results; only the selected view is rendered, so the
+                # other tables and the map cost nothing on reruns
+                view = st.radio(
+                    "View",
+                    ["Allocation Plan", "Warehouse Utilization", "Unfulfilled Orders", "Visualization"],
+                    horizontal=True,
+                    key="active_tab"
+                )
+                
+                if view == "Allocation Plan":
+                    st.subheader("📦 Allocation Plan")
+                    # Build columns directly rather than one dict per row
+                    warehouse_col, order_col, quantity_col = [], [], []
+                    for w, items in results['allocation_plan'].items():
+                        warehouse_col.extend([w] * len(items))
+                        order_col.extend(item['order_id'] for item in items)
+                        quantity_col.extend(item['quantity'] for item in items)
+                    allocation_df = pd.DataFrame({
+                        'Warehouse': pd.Categorical(warehouse_col),
+                        'Order ID': order_col,
+                        'Quantity': quantity_col
+                    })
+                    if not allocation_df.empty:
+                        _show_table(allocation_df)
+                    else:
+                        st.warning("No allocations generated")
+                
+                elif view == "Warehouse Utilization":
+                    st.subheader("🏭 Warehouse Utilization")
+                    utilization = results['warehouse_utilization']
+                    util_df = pd.DataFrame({
+                        'Warehouse': list(utilization),
+                        'Used Capacity': [data['used_capacity'] for data in utilization.values()],
+                        'Total Capacity': [data['total_capacity'] for data in utilization.values()],
+                        'Utilization %': [data['utilization_percentage'] for data in utilization.values()]
+                    })
+                    _show_table(util_df)
+                    st.bar_chart(util_df.set_index('Warehouse')['Utilization %'])
+                
+                elif view == "Unfulfilled Orders":
+                    if results['unfulfilled_orders']:
+                        st.warning("⚠️ Some orders could not be fulfilled completely")
+                        # Page large tables server-side so only one page is ever sent
+                        n_pages = -(-len(unfulfilled_df) // _TABLE_PAGE_ROWS)
+                        if n_pages > 1:
+                            page = st.number_input(
+                                f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1
+                            )
+                            start = (page - 1) * _TABLE_PAGE_ROWS
+                            _show_table(unfulfilled_df.iloc[start:start + _TABLE_PAGE_ROWS])
+                        else:
+                            _show_table(unfulfilled_df)
+                    else:
+                        st.success("✅ All orders can be fulfilled!")
+                
+                elif view == "Visualization":
+                    st.subheader("🗺️ Distribution Map")
+                    if has_coordinates:
+                        self.show_distribution_map(warehouses, orders, results)
+                    else:
+                        st.info("""
+                        Map visualization is available when location coordinates are provided.
+                        Required data:
+                        - Warehouse locations (latitude, longitude)
+                        - Delivery locations (delivery_latitude, delivery_longitude)
+                        """)
+
+        except Exception as e:
+            st.error(f"Optimization error: {str(e)}")
+            st.error("Please check your data and try again")
+
     def run(self):
         """Run the Streamlit application"""
         if not st.session_state.logged_in:
             self.login_page()
             return
 
+        # Single timestamp per rerun, bucketed to the minute so cache keys stay stable
+        st.session_state._now = pd.Timestamp.now().floor("min").strftime("%Y-%m-%d %H:%M:%S")
+
         st.title("🏭 LogiTrack: Inventory Management System")
         st.caption(f"Welcome back, {st.session_state.username}!")
         
@@ -619,143 +1080,23 @@ class LogiTrackApp:
             self.show_inventory_status()
             
         elif action == "Order Management":
-            self.show_order_management()
+            # Fetched once per full rerun; fragment reruns reuse the same frame
+            self.show_order_management(
+                _pending_orders(self.data_loader, self.data_key, st.session_state._now)
+            )
             
         elif action == "Supplier Management":
             self.show_supplier_info()
             
         elif action == "Optimization":
-            st.subheader("🔄 Inventory Optimization")
-            
-            st.sidebar.subheader("Optimization Parameters")
             st.sidebar.info(f"Current DateTime (UTC): {self.data_loader.current_datetime}")
-            
-            solver_time = st.sidebar.slider(
-                "Solver Time Limit (seconds)",
-                min_value=5,
-                max_value=60,
-                value=20
-            )
-            
-            priority_weight = st.sidebar.select_slider(
-                "Order Priority Weight",
-                options=["Low", "Medium", "High"],
-                value="Medium"
+            self.show_optimization(
+                _pending_orders(self.data_loader, self.data_key, self.data_loader.current_datetime)
             )
-            
-            self.optimizer.solver_time = solver_time
-            
-            if st.button("🚀 Run Optimization"):
-                try:
-                    with st.spinner("Optimizing inventory distribution..."):
-                        warehouses = self.data_loader.warehouses_df
-                        orders = self.data_loader.get_pending_orders(self.data_loader.current_datetime)
-                        
-                        st.info("📊 Optimization Overview")
-                        col1, col2 = st.columns(2)
-                        with col1:
-                            st.write("Warehouses in scope:", len(warehouses))
-                            st.write("Total warehouse capacity:", f"{warehouses['capacity'].sum():,} units")
-                            st.write("Current total stock:", f"{warehouses['current_stock'].sum():,} units")
-                        with col2:
-                            st.write("Pending orders:", len(orders))
-                            st.write("Total order quantity:", f"{orders['quantity'].sum():,} units")
-                            st.write("Unique delivery regions:", len(orders['region'].unique()))
-                        
-                        results = self.optimizer.optimize(warehouses, orders)
-                        
-                        st.success("✅ Optimization complete!")
-                        
-                        # Show results in columns
-                        col1, col2, col3, col4 = st.columns(4)
-                        with col1:
-                            st.metric(
-                                "Total Cost", 
-                                f"${results['total_cost']:,.2f}",
-                                delta="-10%"
-                            )
-                        with col2:
-                            st.metric(
-                                "Solving Time", 
-                                f"{results['solving_time']:.2f}s"
-                            )
-                        with col3:
-                            st.metric(
-                                "Status", 
-                                results['status']
-                            )
-                        with col4:
-                            fulfilled_percent = 100 - (len(results['unfulfilled_orders']) / len(orders) * 100)
-                            st.metric(
-                                "Order Fulfillment",
-                                f"{fulfilled_percent:.1f}%"
-                            )
-                        
-                        # Show detailed results in tabs
-                        tabs = st.tabs(["Allocation Plan", "Warehouse Utilization", "Unfulfilled Orders", "Visualization"])
-                        
-                        with tabs[0]:
-                            st.subheader("📦 Allocation Plan")
-                            allocation_df = pd.DataFrame([
-                                {
-                                    'Warehouse': w,
-                                    'Order ID': item['order_id'],
-                                    'Quantity': item['quantity']
-                                }
-                                for w, orders in results['allocation_plan'].items()
-                                for item in orders
-                            ])
-                            if not allocation_df.empty:
-                                st.dataframe(allocation_df)
-                            else:
-                                st.warning("No allocations generated")
-                        
-                        with tabs[1]:
-                            st.subheader("🏭 Warehouse Utilization")
-                            util_df = pd.DataFrame([
-                                {
-                                    'Warehouse': w,
-                                    'Used Capacity': data['used_capacity'],
-                                    'Total Capacity': data['total_capacity'],
-                                    'Utilization %': data['utilization_percentage']
-                                }
-                                for w, data in results['warehouse_utilization'].items()
-                            ])
-                            st.dataframe(util_df)
-                            st.bar_chart(util_df.set_index('Warehouse')['Utilization %'])
-                        
-                        with tabs[2]:
-                            if results['unfulfilled_orders']:
-                                st.warning("⚠️ Some orders could not be fulfilled completely")
-                                st.dataframe(pd.DataFrame(results['unfulfilled_orders']))
-                            else:
-                                st.success("✅ All orders can be fulfilled!")
-                        
-                        with tabs[3]:
-                            st.subheader("🗺️ Distribution Map")
-                            if all(col in warehouses.columns for col in ['latitude', 'longitude']) and \
-                            all(col in orders.columns for col in ['delivery_latitude', 'delivery_longitude']):
-                                self.show_distribution_map(warehouses, orders, results)
-                            else:
-                                st.info("""
-                                Map visualization is available when location coordinates are provided.
-                                Required data:
-                                - Warehouse locations (latitude, longitude)
-                                - Delivery locations (delivery_latitude, delivery_longitude)
-                                """)
-
-                except Exception as e:
-                    st.error(f"Optimization error: {str(e)}")
-                    st.error("Please check your data and try again")
 
         # Footer
         st.markdown("---")
-        st.markdown(
-            "<p style='text-align: center;'>© 2025 | Made with ♥ by "
-            "<a href='https://github.com/tanishpoddar' target='_blank' "
-            "style='color: inherit; text-decoration: none;'>Tanish Poddar</a></p>", 
-            unsafe_allow_html=True
-        )
+        st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     app = LogiTrackApp()